@@ -0,0 +1,73 @@
+# academy_admission.py
+# Mpho Mafolo Academy - rate limiting and database admission control for the API
+#
+# Plain Python (no Flask) so the timing logic can be checked on its own.
+# Every method that depends on the clock takes an optional `now` for that reason.
+
+import math
+import threading
+import time
+from collections import OrderedDict
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity, now):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def consume(self, now):
+        # Returns 0 when a token was taken, otherwise seconds until the next one
+        self.refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+
+class AdmissionController:
+    def __init__(self, max_concurrent=1, queue_timeout=2.0, max_buckets=10000):
+        self.queue_timeout = queue_timeout
+        self.max_buckets = max_buckets
+        self.buckets = OrderedDict()  # least recently used first
+        self.lock = threading.Lock()
+        self.db_slots = threading.BoundedSemaphore(max_concurrent)
+
+    def check_rate(self, key, rate, burst, now=None):
+        if now is None:
+            now = time.monotonic()
+        with self.lock:
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                # An evicted client simply starts again with a full bucket
+                while len(self.buckets) >= self.max_buckets:
+                    self.buckets.popitem(last=False)
+                bucket = self.buckets[key] = TokenBucket(rate, burst, now)
+            else:
+                self.buckets.move_to_end(key)
+            return bucket.consume(now)
+
+    def admit(self, client, route, rate, burst, route_rate=None, route_burst=None, now=None):
+        # Returns None once a database slot is held (call release() afterwards),
+        # otherwise (status, retry_after) for the response to send instead
+        wait = self.check_rate((client, route), rate, burst, now)
+        if not wait and route_rate:
+            # Shared by every client, so many addresses cannot add up to a flood
+            wait = self.check_rate(('*', route), route_rate, route_burst, now)
+        if wait:
+            return 429, wait
+        if not self.db_slots.acquire(timeout=self.queue_timeout):
+            return 503, 1
+        return None
+
+    def release(self):
+        self.db_slots.release()
+
+
+def retry_after_header(seconds):
+    return str(max(1, math.ceil(seconds)))
@@ -0,0 +1,127 @@
+# academy_web.py
+# Mpho Mafolo Academy - Flask web interface and JSON API
+
+from functools import wraps
+from flask import Flask, request, jsonify, render_template
+from flask_cors import CORS
+from academy_admission import AdmissionController, retry_after_header
+
+# ============================================
+# ADMISSION CONTROL
+# ============================================
+
+# Seconds a request waits for the database before it is shed with 503. The page
+# loads stats and players in parallel, so this must cover one real query.
+DB_QUEUE_TIMEOUT = 2.0
+
+REJECT_MESSAGES = {
+    429: 'Too many requests, please slow down',
+    503: 'Server is busy, please try again shortly',
+}
+
+def reject(status, message, retry_after):
+    response = jsonify({'success': False, 'message': message})
+    response.status_code = status
+    response.headers['Retry-After'] = retry_after_header(retry_after)
+    return response
+
+def limit(admission, rate, burst, route_rate=None, route_burst=None):
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            rejected = admission.admit(request.remote_addr, view.__name__, rate, burst,
+                                       route_rate, route_burst)
+            if rejected:
+                status, retry_after = rejected
+                return reject(status, REJECT_MESSAGES[status], retry_after)
+            try:
+                return view(*args, **kwargs)
+            finally:
+                admission.release()
+        return wrapper
+    return decorator
+
+# ============================================
+# FLASK WEB APPLICATION
+# ============================================
+
+# Origins allowed to call the API from a browser (the admin page itself is same-origin)
+ALLOWED_ORIGINS = [
+    'http://localhost:5000',
+    'http://127.0.0.1:5000',
+    'https://mphomafolosocceracademy.vercel.app',
+]
+
+def create_app(db=None, queue_timeout=None):
+    if db is None:
+        from academy_database import DB_CONFIG, MphoAcademyDatabase
+        db = MphoAcademyDatabase(**DB_CONFIG)
+
+    app = Flask(__name__)
+    CORS(app, resources={r'/api/*': {'origins': ALLOWED_ORIGINS}}, expose_headers=['Retry-After'])
+
+    # One slot because every route shares the single MySQL connection held by
+    # MphoAcademyDatabase, and a mysql.connector connection is not thread-safe
+    admission = AdmissionController(
+        max_concurrent=1,
+        queue_timeout=DB_QUEUE_TIMEOUT if queue_timeout is None else queue_timeout
+    )
+
+    # ============================================
+    # API ROUTES
+    # ============================================
+
+    @app.route('/')
+    def index():
+        return render_template('player_management.html')
+
+    # rate (requests per second) and burst apply per client IP and route;
+    # route_rate and route_burst are shared by all clients of the route
+    @app.route('/api/stats')
+    @limit(admission, rate=2, burst=10)
+    def get_stats():
+        stats = db.get_academy_stats()
+        return jsonify(stats)
+
+    @app.route('/api/players', methods=['GET'])
+    @limit(admission, rate=2, burst=10)
+    def get_players():
+        status = request.args.get('status', 'All')
+        players = db.get_all_players(status)
+        if players is None:
+            response = jsonify({'success': False, 'message': 'Could not load players'})
+            response.status_code = 500
+            return response
+        return jsonify(players)
+
+    @app.route('/api/players/search')
+    @limit(admission, rate=5, burst=10, route_rate=20, route_burst=40)
+    def search_players():
+        search_term = request.args.get('q', '')
+        players = db.search_players(search_term)
+        return jsonify(players)
+
+    @app.route('/api/players', methods=['POST'])
+    @limit(admission, rate=0.2, burst=5, route_rate=1, route_burst=10)
+    def add_player():
+        try:
+            player_data = request.get_json()
+            player_id = db.add_player(player_data)
+            
+            if player_id:
+                return jsonify({'success': True, 'player_id': player_id})
+            else:
+                return jsonify({'success': False, 'message': 'Failed to add player'})
+        except Exception as e:
+            return jsonify({'success': False, 'message': str(e)})
+
+    @app.route('/api/players/<int:player_id>', methods=['DELETE'])
+    @limit(admission, rate=1, burst=5, route_rate=2, route_burst=10)
+    def delete_player(player_id):
+        try:
+            success = db.delete_player(player_id)
+            return jsonify({'success': success})
+        except Exception as e:
+            return jsonify({'success': False, 'message': str(e)})
+
+    return app
@@ -0,0 +1,79 @@
+# startup_benchmark.py
+# Mpho Mafolo Academy - measures CLI import time and web app readiness
+# Run: python benchmarks/startup_benchmark.py [--runs 10]
+#
+# Each scenario runs in a fresh interpreter so nothing is already imported.
+# "ready" means the app has been built and has answered its first request;
+# no MySQL server is needed because the home page does not touch the database.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    'import CLI': """
+import mpho_academy_db
+""",
+    'CLI --help': """
+import contextlib, io, mpho_academy_db
+with contextlib.redirect_stdout(io.StringIO()):
+    try:
+        mpho_academy_db.main(['--help'])
+    except SystemExit:
+        pass
+""",
+    'import web app': """
+import academy_web
+""",
+    'app ready': """
+from academy_web import create_app
+app = create_app()
+assert app.test_client().get('/').status_code == 200
+""",
+}
+
+TIMER = """
+import time
+_start = time.perf_counter()
+{body}
+print(time.perf_counter() - _start)
+"""
+
+
+def run_scenario(body):
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-c', TIMER.format(body=body)],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    process_time = time.perf_counter() - started
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"exit code {result.returncode}")
+    return float(result.stdout.strip().splitlines()[-1]), process_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure startup latency')
+    parser.add_argument('--runs', type=int, default=10, help='runs per scenario (default: 10)')
+    args = parser.parse_args()
+
+    print(f"{'scenario':<16}{'in-process ms':>16}{'process ms':>14}   (median of {args.runs})")
+    for name, body in SCENARIOS.items():
+        try:
+            timings = [run_scenario(body) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"{name:<16}  skipped: {e}")
+            continue
+        inner = statistics.median(t[0] for t in timings) * 1000
+        outer = statistics.median(t[1] for t in timings) * 1000
+        print(f"{name:<16}{inner:>16.1f}{outer:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+from academy_admission import AdmissionController, TokenBucket, retry_after_header
+
+
+def test_new_bucket_starts_full():
+    bucket = TokenBucket(rate=1, capacity=3, now=100.0)
+    assert [bucket.consume(100.0) for _ in range(3)] == [0, 0, 0]
+    assert bucket.consume(100.0) == 1.0
+
+
+def test_bucket_refills_at_rate_up_to_capacity():
+    bucket = TokenBucket(rate=2, capacity=2, now=0.0)
+    bucket.consume(0.0)
+    bucket.consume(0.0)
+    assert bucket.consume(0.25) == 0.25  # half a token back, half still missing
+    assert bucket.consume(0.5) == 0
+    bucket.refill(60.0)
+    assert bucket.tokens == 2
+
+
+def test_retry_after_rounds_up_to_whole_seconds():
+    assert retry_after_header(0.01) == '1'
+    assert retry_after_header(1.0) == '1'
+    assert retry_after_header(4.2) == '5'
+
+
+def test_first_request_from_new_client_is_admitted():
+    admission = AdmissionController()
+    assert admission.admit('10.0.0.1', 'add_player', rate=0.2, burst=1, now=5.0) is None
+
+
+def test_client_over_its_rate_gets_429_with_wait():
+    admission = AdmissionController(max_concurrent=10)
+    assert admission.admit('10.0.0.1', 'add_player', rate=0.2, burst=1, now=0.0) is None
+    assert admission.admit('10.0.0.1', 'add_player', rate=0.2, burst=1, now=1.0) == (429, 4.0)
+    # Other clients and other routes have their own buckets
+    assert admission.admit('10.0.0.2', 'add_player', rate=0.2, burst=1, now=1.0) is None
+    assert admission.admit('10.0.0.1', 'get_stats', rate=0.2, burst=1, now=1.0) is None
+
+
+def test_route_limit_is_shared_across_clients():
+    admission = AdmissionController(max_concurrent=10)
+    results = [
+        admission.admit(f'10.0.0.{i}', 'add_player', rate=1, burst=5,
+                        route_rate=1, route_burst=3, now=0.0)
+        for i in range(5)
+    ]
+    assert results[:3] == [None, None, None]
+    assert results[3] == (429, 1.0)
+    assert results[4] == (429, 1.0)
+
+
+def test_busy_database_sheds_with_503():
+    admission = AdmissionController(max_concurrent=1, queue_timeout=0)
+    assert admission.admit('10.0.0.1', 'get_players', rate=10, burst=10, now=0.0) is None
+    assert admission.admit('10.0.0.2', 'get_players', rate=10, burst=10, now=0.0) == (503, 1)
+    admission.release()
+    assert admission.admit('10.0.0.2', 'get_players', rate=10, burst=10, now=0.0) is None
+
+
+def test_least_recently_used_bucket_is_evicted():
+    admission = AdmissionController(max_buckets=3)
+    admission.check_rate('throttled', rate=0.001, burst=1, now=0.0)
+    admission.check_rate('a', rate=0.001, burst=1, now=1.0)
+    admission.check_rate('b', rate=0.001, burst=1, now=2.0)
+    assert admission.check_rate('throttled', rate=0.001, burst=1, now=3.0) > 0
+    admission.check_rate('c', rate=0.001, burst=1, now=4.0)
+    assert list(admission.buckets) == ['b', 'throttled', 'c']
+    # The throttled client kept its empty bucket
+    assert admission.check_rate('throttled', rate=0.001, burst=1, now=5.0) > 0